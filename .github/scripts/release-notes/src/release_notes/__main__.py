@@ -11,7 +11,7 @@ from release_notes import formatter, git, parser
 
 def find_workspace_root(start_path: Path) -> Path | None:
     """
-    Recursively traverse up the directory tree to find the workspace root.
+    Traverse up the directory tree to find the workspace root.
 
     Looks for Cargo.toml as a marker file indicating the workspace root.
     Stops at filesystem root if not found.
@@ -22,20 +22,19 @@ def find_workspace_root(start_path: Path) -> Path | None:
     Returns:
         Path to workspace root directory if found, None otherwise
     """
-    start_path = start_path.resolve()
+    # Resolve once, then walk up with plain strings instead of Path objects
+    current = os.path.realpath(start_path)
 
-    # Check if Cargo.toml exists in current directory
-    cargo_toml = start_path / "Cargo.toml"
-    if cargo_toml.exists():
-        return start_path
+    while True:
+        # Check if Cargo.toml exists in current directory
+        if os.path.isfile(os.path.join(current, "Cargo.toml")):
+            return Path(current)
 
-    # Base case: reached filesystem root
-    parent = start_path.parent
-    if parent == start_path:  # At root directory (e.g., / on Unix, C:\ on Windows)
-        return None
-
-    # Recursive case: traverse up one level
-    return find_workspace_root(parent)
+        # Reached filesystem root (e.g., / on Unix, C:\ on Windows)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
 
 
 def get_workspace_root() -> Path:
@@ -56,7 +55,11 @@ def get_workspace_root() -> Path:
     workspace_env = os.environ.get("GITHUB_WORKSPACE")
     if workspace_env:
         workspace_path = Path(workspace_env)
-        if workspace_path.exists() and workspace_path.is_dir():
+        # is_dir() is False for missing paths, so a single stat covers both checks
+        if workspace_path.is_dir():
+            # GitHub Actions sets an absolute, real directory: skip resolve() for it
+            if workspace_path.is_absolute() and not workspace_path.is_symlink():
+                return workspace_path
             return workspace_path.resolve()
         print(
             f"Warning: GITHUB_WORKSPACE points to non-existent directory: {workspace_env}",
@@ -98,7 +101,8 @@ def main() -> int:
 
     try:
         # Initialize GitHub client
-        github = Github(auth=Auth.Token(github_token))
+        # Use the maximum page size so commit and tag listings need fewer round-trips
+        github = Github(auth=Auth.Token(github_token), per_page=100)
         repo = github.get_repo(github_repository)
     except GithubException as e:
         print(f"Error accessing repository {github_repository}: {e}", file=sys.stderr)
@@ -122,16 +126,18 @@ def main() -> int:
             print(f"Error: Tag {current_tag_name} not found in repository", file=sys.stderr)
             return 1
 
-        # Get previous tag
-        previous_tag = git.get_previous_tag(repo, current_tag_name)
+        # Get previous tag (reuse the fetched tag list instead of paginating again)
+        previous_tag = git.get_previous_tag(repo, current_tag_name, tags=tags)
 
-        # Get commits
+        # Get commits. Both helpers return fully fetched lists; the commits are
+        # iterated several times below (path split, grouping, statistics), so
+        # holding them in memory avoids re-fetching pages for every pass.
         if previous_tag:
             commits = git.get_commits_between_tags(repo, previous_tag, current_tag)
             previous_tag_name = previous_tag.name
         else:
-            # First release: get all commits
-            commits = git.get_all_commits(repo)
+            # First release: get all commits reachable from the current tag
+            commits = git.get_all_commits(repo, sha=current_tag_name)
             previous_tag_name = None
 
         # Split commits into application and other
@@ -160,17 +166,14 @@ def main() -> int:
         github_output = os.environ.get("GITHUB_OUTPUT")
         if github_output:
             output_file = Path(github_output)
-            with output_file.open("a") as f:
-                f.write("notes<<EOF\n")
-                f.write(release_notes)
-                f.write("\nEOF\n")
+            with output_file.open("a", encoding="utf-8") as f:
+                f.write(f"notes<<EOF\n{release_notes}\nEOF\n")
 
         # Write to release_notes.md file at workspace root
         try:
             workspace_root = get_workspace_root()
             output_file = workspace_root / "release_notes.md"
-            with output_file.open("w") as f:
-                f.write(release_notes)
+            output_file.write_text(release_notes, encoding="utf-8")
             print(f"   Release notes written to: {output_file}")
         except RuntimeError as e:
             print(f"Error: {e}", file=sys.stderr)
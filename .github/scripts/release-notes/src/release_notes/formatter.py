@@ -1,6 +1,5 @@
 """Markdown release notes formatter."""
 
-from collections import defaultdict
 from typing import Optional
 
 from release_notes import parser
@@ -50,21 +49,19 @@ def group_by_type(commits: list) -> dict:
     Returns:
         Dictionary mapping types to commit lists
     """
-    grouped = defaultdict(list)
-    breaking_commits = []
+    # Categories are limited to the known types, so preallocate their lists
+    grouped: dict[str, list] = {commit_type: [] for commit_type in TYPE_LABELS}
 
     for commit in commits:
         if parser.is_breaking_change(commit):
-            breaking_commits.append(commit)
+            # Breaking changes are collected as a separate group
+            grouped["breaking"].append(commit)
         else:
             category = parser.categorize_commit(commit)
             grouped[category].append(commit)
 
-    # Add breaking changes as separate group
-    if breaking_commits:
-        grouped["breaking"] = breaking_commits
-
-    return dict(grouped)
+    # Only return groups that received commits
+    return {commit_type: group for commit_type, group in grouped.items() if group}
 
 
 def format_commit_entry(commit: object, repo_url: Optional[str] = None) -> str:
@@ -1,6 +1,7 @@
 """Git operations using PyGitHub."""
 
 import subprocess
+from operator import itemgetter
 from typing import Optional
 
 from github import Repository
@@ -11,52 +12,45 @@ def get_tags_sorted(repo: Repository) -> list:
     """
     Get tags sorted by semantic version (descending: newest first).
 
+    Tags that cannot be parsed as a semantic version are skipped.
+
     Args:
         repo: GitHub repository object
 
     Returns:
-        List of tags sorted by semantic version (newest first)
-
-    Raises:
-        ValueError: If a tag cannot be parsed as a semantic version
+        List of tags sorted by semantic version (newest first). The paginated
+        listing is consumed once, so the result can be iterated repeatedly
+        without further API requests.
     """
-    tags = list(repo.get_tags())
+    # Parse each tag version once, skipping tags that are not valid versions
+    parsed_tags = []
+    for tag in repo.get_tags():
+        try:
+            parsed_tags.append((version.parse(tag.name.removeprefix("v")), tag))
+        except version.InvalidVersion:
+            continue
+
     # Sort by semantic version
-    try:
-        tags.sort(
-            key=lambda t: version.parse(t.name.lstrip("v")),
-            reverse=True,
-        )
-    except version.InvalidVersion as e:
-        # Filter out invalid version tags and log warning
-        valid_tags = []
-        for tag in tags:
-            try:
-                version.parse(tag.name.lstrip("v"))
-                valid_tags.append(tag)
-            except version.InvalidVersion:
-                # Skip invalid version tags
-                continue
-        tags = valid_tags
-        tags.sort(
-            key=lambda t: version.parse(t.name.lstrip("v")),
-            reverse=True,
-        )
-    return tags
+    parsed_tags.sort(key=itemgetter(0), reverse=True)
+    return [tag for _, tag in parsed_tags]
 
 
-def get_previous_tag(repo: Repository, current_tag_name: str) -> Optional[object]:
+def get_previous_tag(
+    repo: Repository, current_tag_name: str, tags: Optional[list] = None
+) -> Optional[object]:
     """
     Get the previous tag before the current tag.
 
     Args:
         repo: GitHub repository object
         current_tag_name: Name of the current tag (e.g., "v1.2.0")
+        tags: Already sorted tags from get_tags_sorted (fetched from repo if None)
 
     Returns:
         Previous tag object, or None if this is the first tag
     """
-    tags = get_tags_sorted(repo)
+    if tags is None:
+        tags = get_tags_sorted(repo)
     if not tags:
         return None
 
@@ -91,7 +85,8 @@ def get_commits_between_tags(
         current_tag: Current tag object
 
     Returns:
-        List of commit objects between the two tags
+        List of commit objects between the two tags (fully fetched, safe to
+        iterate multiple times)
     """
     if previous_tag is None:
         return []
@@ -104,25 +99,24 @@ def get_commits_between_tags(
     return list(comparison.commits)
 
 
-def get_all_commits(repo: Repository) -> list:
+def get_all_commits(repo: Repository, sha: Optional[str] = None) -> list:
     """
     Get all commits from the repository (for first release).
 
     Args:
         repo: GitHub repository object
+        sha: Tag name or SHA to list commits from (defaults to the default branch)
 
     Returns:
         List of all commit objects
     """
-    commits = []
-    for commit in repo.get_commits():
-        commits.append(commit)
-    return commits
+    paginated = repo.get_commits(sha=sha) if sha else repo.get_commits()
+    return list(paginated)
 
 
 def get_commit_shas_by_path(
     previous_tag: Optional[str], current_tag: str, paths: list[str]
-) -> set[str]:
+) -> frozenset[str]:
     """
     Get commit SHAs that modify specified paths using git CLI.
 
@@ -132,7 +126,7 @@ def get_commit_shas_by_path(
         paths: List of paths to filter by (e.g., ["src/", "Cargo.toml", "Cargo.lock"])
 
     Returns:
-        Set of commit SHAs that modify the specified paths
+        Frozen set of commit SHAs that modify the specified paths
     """
     try:
         if previous_tag:
@@ -143,7 +137,8 @@ def get_commit_shas_by_path(
         result = subprocess.run(
             [
                 "git",
-                "rev-list",
+                "log",
+                "--format=%H",
                 range_spec,
                 "--",
                 *paths,
@@ -152,10 +147,11 @@ def get_commit_shas_by_path(
             text=True,
             check=True,
         )
-        return set(result.stdout.strip().split("\n")) if result.stdout.strip() else set()
+        # split() drops the trailing newline and yields nothing for empty output
+        return frozenset(result.stdout.split())
     except subprocess.CalledProcessError:
         # If tag doesn't exist or no commits, return empty set
-        return set()
+        return frozenset()
 
 
 def split_commits_by_path(
@@ -176,15 +172,30 @@ def split_commits_by_path(
     Returns:
         Tuple of (application_commits, other_commits)
     """
+    if not commits:
+        return [], []
+
     # Get SHAs of commits that modify application paths
     application_shas = get_commit_shas_by_path(previous_tag, current_tag, application_paths)
 
+    # Nothing touched application paths: every commit is "other"
+    if not application_shas:
+        return [], list(commits)
+
+    # Commit lists are homogeneous, so decide once how to read the SHA
+    if hasattr(commits[0], "sha"):
+        commit_shas = [commit.sha for commit in commits]
+    else:
+        commit_shas = [str(commit) for commit in commits]
+
+    # Every commit touched application paths: nothing is "other"
+    if application_shas.issuperset(commit_shas):
+        return list(commits), []
+
     application_commits = []
     other_commits = []
-
-    for commit in commits:
-        commit_sha = commit.sha if hasattr(commit, "sha") else str(commit)
-        if commit_sha in application_shas:
+    for commit, sha in zip(commits, commit_shas):
+        if sha in application_shas:
             application_commits.append(commit)
         else:
             other_commits.append(commit)
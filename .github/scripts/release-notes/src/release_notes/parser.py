@@ -2,10 +2,39 @@
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Tuple
 
-
-@dataclass
+# Conventional Commits subject line: type(scope)!: subject (used with fullmatch)
+_CONVENTIONAL_COMMIT_RE = re.compile(
+    r"(?P<type>\w+)(?:\((?P<scope>[^)]+)\))?(?P<breaking>!)?:\s*(?P<subject>.+)"
+)
+
+# Breaking change footer token, in either the space or hyphen form
+_BREAKING_CHANGE_RE = re.compile(r"BREAKING[ -]CHANGE:")
+
+# Map commit types (including common aliases) to categories
+_TYPE_MAPPING = {
+    "feat": "feat",
+    "feature": "feat",
+    "fix": "fix",
+    "bugfix": "fix",
+    "docs": "docs",
+    "documentation": "docs",
+    "style": "style",
+    "refactor": "refactor",
+    "perf": "perf",
+    "performance": "perf",
+    "test": "test",
+    "tests": "test",
+    "chore": "chore",
+    "ci": "ci",
+    "build": "build",
+    "revert": "revert",
+}
+
+
+@dataclass(frozen=True, slots=True)
 class ParsedCommit:
     """Parsed commit message structure."""
 
@@ -17,34 +46,35 @@ class ParsedCommit:
     is_breaking: bool
 
 
+@lru_cache(maxsize=4096)
 def parse_commit_message(message: str) -> ParsedCommit:
     """
     Parse Conventional Commits format: type(scope): subject.
 
+    Results are cached per message, since each commit is parsed by several
+    helpers (grouping, breaking-change detection, formatting).
+
     Args:
         message: Full commit message (subject + body)
 
     Returns:
         ParsedCommit object with parsed components
     """
-    # Split message into subject and body
-    lines = message.split("\n")
-    subject = lines[0] if lines else ""
-    body_lines = lines[1:] if len(lines) > 1 else []
-    body = "\n".join(body_lines) if body_lines else None
+    # Split message into subject and body (only the first newline matters)
+    subject, separator, rest = message.partition("\n")
+    body = rest if separator else None
 
     # Parse subject: type(scope): subject or type: subject
-    pattern = r"^(\w+)(?:\(([^)]+)\))?(!)?:\s*(.+)$"
-    match = re.match(pattern, subject)
+    # A subject without a colon can never match, so skip the regex for it
+    match = _CONVENTIONAL_COMMIT_RE.fullmatch(subject) if ":" in subject else None
 
     if match:
-        commit_type = match.group(1)
-        scope = match.group(2)
-        breaking_indicator = match.group(3)  # '!' if present
-        subject_text = match.group(4)
+        commit_type = match["type"]
+        scope = match["scope"]
+        subject_text = match["subject"]
 
-        # Check for breaking change in footer
-        is_breaking = breaking_indicator == "!" or _has_breaking_change_footer(body)
+        # '!' marks a breaking change, otherwise check the footer
+        is_breaking = match["breaking"] is not None or _has_breaking_change_footer(body)
 
         return ParsedCommit(
             type=commit_type,
@@ -70,7 +100,7 @@ def _has_breaking_change_footer(body: Optional[str]) -> bool:
     """Check if commit has BREAKING CHANGE in footer."""
     if not body:
         return False
-    return "BREAKING CHANGE:" in body or "BREAKING-CHANGE:" in body
+    return _BREAKING_CHANGE_RE.search(body) is not None
 
 
 def _extract_footer(body: Optional[str]) -> Optional[str]:
@@ -84,6 +114,12 @@ def _extract_footer(body: Optional[str]) -> Optional[str]:
     return None
 
 
+def _commit_message(commit: object) -> str:
+    """Get the message of a commit object, or the commit itself as a string."""
+    inner = getattr(commit, "commit", None)
+    return inner.message if inner is not None else str(commit)
+
+
 def categorize_commit(commit: object) -> str:
     """
     Categorize commit by Conventional Commits type.
@@ -94,31 +130,9 @@ def categorize_commit(commit: object) -> str:
     Returns:
         Category string (feat, fix, docs, etc.)
     """
-    message = commit.commit.message if hasattr(commit, "commit") else str(commit)
-    parsed = parse_commit_message(message)
-
-    # Map types to categories
-    type_mapping = {
-        "feat": "feat",
-        "feature": "feat",
-        "fix": "fix",
-        "bugfix": "fix",
-        "docs": "docs",
-        "documentation": "docs",
-        "style": "style",
-        "refactor": "refactor",
-        "perf": "perf",
-        "performance": "perf",
-        "test": "test",
-        "tests": "test",
-        "chore": "chore",
-        "ci": "ci",
-        "build": "build",
-        "revert": "revert",
-    }
-
-    commit_type = parsed.type.lower()
-    return type_mapping.get(commit_type, "other")
+    message = _commit_message(commit)
+    commit_type = parse_commit_message(message).type.lower()
+    return _TYPE_MAPPING.get(commit_type, "other")
 
 
 def is_breaking_change(commit: object) -> bool:
@@ -131,7 +145,7 @@ def is_breaking_change(commit: object) -> bool:
     Returns:
         True if commit is a breaking change
     """
-    message = commit.commit.message if hasattr(commit, "commit") else str(commit)
+    message = _commit_message(commit)
     parsed = parse_commit_message(message)
     return parsed.is_breaking
 
@@ -115,6 +115,16 @@ class TestGetPreviousTag:
         previous = git.get_previous_tag(mock_repo, "v2.0.0")
         assert previous is None
 
+    def test_get_previous_tag_with_prefetched_tags(self, mock_repo):
+        """Test that prefetched tags are used without listing tags again."""
+        tags = git.get_tags_sorted(mock_repo)
+        mock_repo.get_tags.reset_mock()
+
+        previous = git.get_previous_tag(mock_repo, "v1.1.0", tags=tags)
+        assert previous is not None
+        assert previous.name == "v1.0.0"
+        mock_repo.get_tags.assert_not_called()
+
     def test_get_previous_tag_no_tags(self):
         """Test with no tags."""
         repo = MagicMock()
@@ -161,6 +171,12 @@ class TestGetAllCommits:
         assert commits[0].sha == "commit1"
         assert commits[1].sha == "commit2"
 
+    def test_get_all_commits_from_tag(self, mock_repo_with_commits):
+        """Test listing commits reachable from a specific tag."""
+        commits = git.get_all_commits(mock_repo_with_commits, sha="v1.0.0")
+        assert len(commits) == 2
+        mock_repo_with_commits.get_commits.assert_called_once_with(sha="v1.0.0")
+
     def test_get_all_commits_empty(self):
         """Test with no commits."""
         repo = MagicMock()
@@ -242,6 +258,27 @@ class TestSplitCommitsByPath:
             assert commit2 in app_commits
             assert commit3 in other_commits
 
+    def test_split_commits_by_path_no_commits(self):
+        """Test that git is not invoked when there are no commits."""
+        with patch("release_notes.git.get_commit_shas_by_path") as mock_get_shas:
+            app_commits, other_commits = git.split_commits_by_path([], "v1.0.0", "v1.1.0")
+
+            assert app_commits == []
+            assert other_commits == []
+            mock_get_shas.assert_not_called()
+
+    def test_split_commits_by_path_sha_strings(self):
+        """Test splitting when commits are given as SHA strings."""
+        with patch("release_notes.git.get_commit_shas_by_path") as mock_get_shas:
+            mock_get_shas.return_value = {"abc123"}
+
+            app_commits, other_commits = git.split_commits_by_path(
+                ["abc123", "def456"], "v1.0.0", "v1.1.0"
+            )
+
+            assert app_commits == ["abc123"]
+            assert other_commits == ["def456"]
+
     def test_split_commits_by_path_all_application(self, mock_repo):
         """Test when all commits are application commits."""
         commit1 = Mock()
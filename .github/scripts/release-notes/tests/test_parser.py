@@ -49,6 +49,17 @@ class TestParseCommitMessage:
         parsed = parser.parse_commit_message(message)
         assert parsed.is_breaking is True
 
+    def test_parse_breaking_change_hyphen_footer(self):
+        """Test parsing breaking change with hyphenated footer token."""
+        message = "feat: add new API\n\nBREAKING-CHANGE: Old API removed"
+        parsed = parser.parse_commit_message(message)
+        assert parsed.is_breaking is True
+
+    def test_parse_commit_message_cached(self):
+        """Test that parsing the same message twice reuses the cached result."""
+        message = "feat(cache): reuse parsed commit"
+        assert parser.parse_commit_message(message) is parser.parse_commit_message(message)
+
     def test_parse_non_conventional_commit(self):
         """Test parsing non-conventional commit."""
         message = "Just a regular commit message"
@@ -89,6 +100,17 @@ class TestCategorizeCommit:
         category = parser.categorize_commit(commit)
         assert category == "other"
 
+    def test_categorize_alias_ignores_body(self):
+        """Test categorizing an aliased type using only the subject line."""
+        commit = Mock()
+        commit.commit.message = "Feature(api): add endpoint\n\nfix: not the type"
+        category = parser.categorize_commit(commit)
+        assert category == "feat"
+
+    def test_categorize_plain_message(self):
+        """Test categorizing a value without a commit attribute."""
+        assert parser.categorize_commit("fix: plain string") == "fix"
+
 
 class TestIsBreakingChange:
     """Tests for is_breaking_change function."""
@@ -81,6 +81,18 @@ class TestGetWorkspaceRoot:
             result = __main__.get_workspace_root()
             assert result == workspace_root.resolve()
 
+    def test_resolves_github_workspace_symlink(self, tmp_path):
+        """Test that function resolves GITHUB_WORKSPACE when it is a symlink."""
+        workspace_root = tmp_path / "workspace"
+        workspace_root.mkdir()
+        (workspace_root / "Cargo.toml").write_text("[package]")
+        symlink_dir = tmp_path / "symlink_dir"
+        symlink_dir.symlink_to(workspace_root)
+
+        with patch.dict(os.environ, {"GITHUB_WORKSPACE": str(symlink_dir)}):
+            result = __main__.get_workspace_root()
+            assert result == workspace_root.resolve()
+
     def test_falls_back_to_recursive_search_when_github_workspace_not_set(
         self, tmp_path
     ):
@@ -1,12 +1,21 @@
 """Entry point for test-summary package."""
 
 import argparse
+import glob
 import os
 import sys
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TextIO
 
 from test_summary.formatter import generate_markdown_summary
-from test_summary.parser import parse_junit_xml
+from test_summary.parser import TestSuite, iter_junit_suites
+
+# Below this many files, process start-up costs more than parallel parsing saves
+_PARALLEL_MIN_FILES = 3
+_PARALLEL_MAX_WORKERS = 8
 
 
 def find_xml_files(xml_path: str) -> list[Path]:
@@ -21,31 +30,62 @@ def find_xml_files(xml_path: str) -> list[Path]:
     Returns:
         List of matching XML file paths
     """
-    path = Path(xml_path)
-
-    # If path contains glob patterns, use glob
-    if "*" in str(path) or "**" in str(path):
-        # Find the base directory for globbing
-        parts = path.parts
-        glob_index = next(
-            (i for i, part in enumerate(parts) if "*" in part), len(parts)
+    # If path contains glob patterns, use glob ("**" also contains "*")
+    if "*" in xml_path:
+        # iglob walks with os.scandir and matches "**" recursively; hidden
+        # entries are included to match Path.glob
+        return sorted(
+            Path(match)
+            for match in glob.iglob(xml_path, recursive=True, include_hidden=True)
         )
-        base_dir = Path(*parts[:glob_index]) if glob_index > 0 else Path(".")
-        pattern = str(Path(*parts[glob_index:]))
-
-        if not base_dir.exists():
-            return []
-
-        xml_files = list(base_dir.glob(pattern))
-        return sorted(xml_files)
 
     # Single file path
-    if path.exists():
-        return [path]
+    if os.path.exists(xml_path):
+        return [Path(xml_path)]
 
     return []
 
 
+def parse_suites(xml_file: Path) -> list[TestSuite]:
+    """
+    Parse all test suites from a JUnit XML file.
+
+    Module-level so it can be sent to worker processes.
+
+    Args:
+        xml_file: Path to JUnit XML file
+
+    Returns:
+        List of parsed test suites
+    """
+    return list(iter_junit_suites(xml_file))
+
+
+@contextmanager
+def _open_sink(args: argparse.Namespace) -> Iterator[TextIO]:
+    """
+    Open the destination for the markdown summary.
+
+    Precedence: --output, then $GITHUB_STEP_SUMMARY, then stdout.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Yields:
+        Text stream to write the summary to (stdout is not closed)
+    """
+    output_path = args.output or os.environ.get("GITHUB_STEP_SUMMARY")
+    if not output_path:
+        yield sys.stdout
+        return
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        yield f
+
+
 def main() -> int:
     """Main entry point for test-summary application."""
     parser = argparse.ArgumentParser(
@@ -64,6 +104,11 @@ def main() -> int:
         "--output",
         help="Path to output file (default: $GITHUB_STEP_SUMMARY or stdout)",
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Parse XML files concurrently in worker processes",
+    )
 
     args = parser.parse_args()
 
@@ -80,29 +125,47 @@ def main() -> int:
     # Parse all XML files and combine results
     all_suites = []
     total_tests = 0
-    total_passed = 0
     total_failed = 0
     total_skipped = 0
     total_duration = 0.0
 
-    for xml_file in xml_files:
-        try:
-            results = parse_junit_xml(xml_file)
-            all_suites.extend(results.suites)
-            total_tests += results.total_tests
-            total_passed += results.total_passed
-            total_failed += results.total_failed
-            total_skipped += results.total_skipped
-            total_duration += results.total_duration
-        except FileNotFoundError as e:
-            print(f"Warning: {e}", file=sys.stderr)
-            continue
-        except Exception as e:
-            print(
-                f"Error parsing {xml_file}: {e}",
-                file=sys.stderr,
-            )
-            return 1
+    executor = None
+    if args.parallel and len(xml_files) >= _PARALLEL_MIN_FILES:
+        executor = ProcessPoolExecutor(
+            max_workers=min(_PARALLEL_MAX_WORKERS, len(xml_files))
+        )
+        # Submit everything up front, then collect in file order
+        pending = [executor.submit(parse_suites, xml_file) for xml_file in xml_files]
+        load = Future.result
+    else:
+        pending = xml_files
+        load = parse_suites
+
+    try:
+        for xml_file, item in zip(xml_files, pending):
+            try:
+                suites = load(item)
+            except FileNotFoundError as e:
+                print(f"Warning: {e}", file=sys.stderr)
+                continue
+            except Exception as e:
+                print(
+                    f"Error parsing {xml_file}: {e}",
+                    file=sys.stderr,
+                )
+                return 1
+
+            for suite in suites:
+                all_suites.append(suite)
+                total_tests += suite.tests
+                total_failed += suite.failures + suite.errors
+                total_skipped += suite.skipped
+                total_duration += suite.duration
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    total_passed = total_tests - total_failed - total_skipped
 
     if not all_suites and total_tests == 0:
         print(
@@ -132,7 +195,9 @@ def main() -> int:
             total_duration=total_duration,
         )
 
-    # Generate markdown summary
+    # Generate the markdown summary before opening the destination, so a
+    # formatting error never leaves a truncated summary file behind (step
+    # summaries are capped at 1 MiB, so the text is small)
     try:
         summary = generate_markdown_summary(combined_results, args.artifact_name)
     except Exception as e:
@@ -142,26 +207,13 @@ def main() -> int:
         traceback.print_exc()
         return 1
 
-    # Determine output destination
-    output_path = None
-    if args.output:
-        output_path = Path(args.output)
-    else:
-        # Try GITHUB_STEP_SUMMARY environment variable
-        github_step_summary = os.environ.get("GITHUB_STEP_SUMMARY")
-        if github_step_summary:
-            output_path = Path(github_step_summary)
-
     # Write summary
     try:
-        if output_path:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with output_path.open("w", encoding="utf-8") as f:
-                f.write(summary)
-            print(f"✅ Test summary written to: {output_path}")
-        else:
-            # Write to stdout
-            print(summary)
+        with _open_sink(args) as out:
+            # Only stdout gets a trailing newline, as print() always added
+            out.write(summary + "\n" if out is sys.stdout else summary)
+        if out is not sys.stdout:
+            print(f"✅ Test summary written to: {out.name}")
     except Exception as e:
         print(f"Error writing summary: {e}", file=sys.stderr)
         return 1
@@ -1,7 +1,16 @@
 """Formatter for generating markdown test summaries."""
 
+import io
+from typing import TextIO
+
 from test_summary.parser import TestResults
 
+# One row of the suites table
+_SUITE_ROW = (
+    "| {name} | {status} | {tests} | {passed} | {failed} | {skipped} | "
+    "{duration:.2f}s |\n"
+)
+
 
 def format_duration(seconds: float) -> str:
     """
@@ -48,119 +57,111 @@ def generate_markdown_summary(
     Returns:
         Markdown formatted summary string
     """
-    lines: list[str] = []
+    buf = io.StringIO()
+    write_markdown_summary(results, buf, artifact_name)
+    # Lines are newline-terminated; the summary itself has no trailing newline
+    return buf.getvalue().removesuffix("\n")
+
+
+def write_markdown_summary(
+    results: TestResults, out: TextIO, artifact_name: str | None = None
+) -> None:
+    """
+    Write markdown summary from test results to a text stream.
+
+    Lines are newline-terminated, including the last one.
+
+    Args:
+        results: Parsed test results
+        out: Text stream to write to (e.g., an open file or sys.stdout)
+        artifact_name: Optional artifact name for linking
+    """
+    write = out.write
 
     # Title
-    lines.append("# Test Results Summary")
-    lines.append("")
+    write("# Test Results Summary\n\n")
 
     # Overall status
     status_emoji = get_status_emoji(
         results.total_passed, results.total_failed, results.total_skipped
     )
-    lines.append(f"**Status**: {status_emoji} ")
+    write(f"**Status**: {status_emoji} \n")
     if results.total_failed > 0:
-        lines.append(
+        write(
             f"{results.total_passed} passed, {results.total_failed} failed, "
-            f"{results.total_skipped} skipped"
+            f"{results.total_skipped} skipped\n\n"
         )
     else:
-        lines.append(
-            f"{results.total_passed} passed, {results.total_skipped} skipped"
-        )
-    lines.append("")
+        write(f"{results.total_passed} passed, {results.total_skipped} skipped\n\n")
+
+    # Failed test details are collected while writing the suite rows, so each
+    # suite's test cases are walked once
+    failed_tests = []
 
     # Test results table
     if results.suites:
-        lines.append("## Test Suites")
-        lines.append("")
-        lines.append("| Suite | Status | Tests | Passed | Failed | Skipped | Duration |")
-        lines.append("|-------|--------|-------|--------|--------|---------|----------|")
+        write("## Test Suites\n\n")
+        write("| Suite | Status | Tests | Passed | Failed | Skipped | Duration |\n")
+        write("|-------|--------|-------|--------|--------|---------|----------|\n")
 
         for suite in results.suites:
-            suite_status = get_status_emoji(
-                suite.tests - suite.failures - suite.errors - suite.skipped,
-                suite.failures + suite.errors,
-                suite.skipped,
-            )
             passed_count = suite.tests - suite.failures - suite.errors - suite.skipped
             failed_count = suite.failures + suite.errors
-
-            lines.append(
-                f"| {suite.name} | {suite_status} | {suite.tests} | "
-                f"{passed_count} | {failed_count} | {suite.skipped} | "
-                f"{format_duration(suite.duration)} |"
+            write(
+                _SUITE_ROW.format(
+                    name=suite.name,
+                    status=get_status_emoji(passed_count, failed_count, suite.skipped),
+                    tests=suite.tests,
+                    passed=passed_count,
+                    failed=failed_count,
+                    skipped=suite.skipped,
+                    duration=suite.duration,
+                )
             )
+            for test_case in suite.test_cases:
+                if test_case.status == "failed":
+                    failed_tests.append((suite.name, test_case))
 
-        lines.append("")
-        lines.append(
-            f"**Total**: {results.total_tests} tests in {len(results.suites)} suite(s) "
-            f"({format_duration(results.total_duration)})"
+        write(
+            f"\n**Total**: {results.total_tests} tests in {len(results.suites)} suite(s) "
+            f"({format_duration(results.total_duration)})\n\n"
         )
-        lines.append("")
 
     # Mermaid pie chart
     if results.total_tests > 0:
-        lines.append("## Test Results Distribution")
-        lines.append("")
-        lines.append("```mermaid")
-        lines.append('pie title "Test Results"')
+        write("## Test Results Distribution\n\n")
+        write("```mermaid\n")
+        write('pie title "Test Results"\n')
         if results.total_passed > 0:
-            lines.append(f'    "Passed" : {results.total_passed}')
+            write(f'    "Passed" : {results.total_passed}\n')
         if results.total_failed > 0:
-            lines.append(f'    "Failed" : {results.total_failed}')
+            write(f'    "Failed" : {results.total_failed}\n')
         if results.total_skipped > 0:
-            lines.append(f'    "Skipped" : {results.total_skipped}')
-        lines.append("```")
-        lines.append("")
+            write(f'    "Skipped" : {results.total_skipped}\n')
+        write("```\n\n")
 
     # Failed test details
-    failed_tests = []
-    for suite in results.suites:
-        for test_case in suite.test_cases:
-            if test_case.status == "failed":
-                failed_tests.append((suite.name, test_case))
-
     if failed_tests:
-        lines.append("## Failed Tests")
-        lines.append("")
+        write("## Failed Tests\n\n")
 
         for suite_name, test_case in failed_tests:
-            lines.append(f"### {suite_name}::{test_case.name}")
-            lines.append("")
+            write(f"### {suite_name}::{test_case.name}\n\n")
             if test_case.error_type:
-                lines.append(f"**Error Type**: `{test_case.error_type}`")
-                lines.append("")
+                write(f"**Error Type**: `{test_case.error_type}`\n\n")
             if test_case.error_message:
                 # Truncate long error messages
                 error_msg = test_case.error_message
                 if len(error_msg) > 500:
                     error_msg = error_msg[:500] + "... (truncated)"
-                lines.append("**Error Message**:")
-                lines.append("")
-                lines.append("```")
-                lines.append(error_msg)
-                lines.append("```")
-                lines.append("")
+                write(f"**Error Message**:\n\n```\n{error_msg}\n```\n\n")
             if test_case.stack_trace and test_case.stack_trace != test_case.error_message:
                 # Only show stack trace if different from error message
                 stack_trace = test_case.stack_trace
                 if len(stack_trace) > 1000:
                     stack_trace = stack_trace[:1000] + "... (truncated)"
-                lines.append("**Stack Trace**:")
-                lines.append("")
-                lines.append("```")
-                lines.append(stack_trace)
-                lines.append("```")
-                lines.append("")
+                write(f"**Stack Trace**:\n\n```\n{stack_trace}\n```\n\n")
 
     # Artifact link
     if artifact_name:
-        lines.append("## Test Artifacts")
-        lines.append("")
-        lines.append(
-            f"Test results are available as artifacts: `{artifact_name}`"
-        )
-        lines.append("")
-
-    return "\n".join(lines)
+        write("## Test Artifacts\n\n")
+        write(f"Test results are available as artifacts: `{artifact_name}`\n\n")
@@ -1,12 +1,16 @@
 """Parser for JUnit XML test results."""
 
+import os
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
+# <testcase> children that mark the test as failed
+_FAULT_TAGS = frozenset(("failure", "error"))
 
-@dataclass
+
+@dataclass(slots=True)
 class TestCase:
     """Represents a single test case."""
 
@@ -19,7 +23,7 @@ class TestCase:
     stack_trace: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TestSuite:
     """Represents a test suite."""
 
@@ -32,7 +36,7 @@ class TestSuite:
     test_cases: List[TestCase]
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResults:
     """Represents parsed test results."""
 
@@ -44,12 +48,14 @@ class TestResults:
     total_duration: float
 
 
-def parse_junit_xml(xml_path: str | Path) -> TestResults:
+def parse_junit_xml(xml_path: str | Path, include_cases: bool = True) -> TestResults:
     """
     Parse JUnit XML file and extract test results.
 
     Args:
         xml_path: Path to JUnit XML file
+        include_cases: Build TestCase objects; when False, suites keep only
+            their counts and test_cases is empty
 
     Returns:
         TestResults object with parsed test data
@@ -59,104 +65,12 @@ def parse_junit_xml(xml_path: str | Path) -> TestResults:
         ET.ParseError: If XML is malformed
         ValueError: If XML structure is invalid
     """
-    xml_path = Path(xml_path)
-
-    if not xml_path.exists():
-        raise FileNotFoundError(f"Test results file not found: {xml_path}")
+    suites = list(iter_junit_suites(xml_path, include_cases))
 
-    try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-    except ET.ParseError as e:
-        raise ET.ParseError(f"Failed to parse XML file {xml_path}: {e}") from e
-
-    suites: List[TestSuite] = []
-    total_tests = 0
-    total_passed = 0
-    total_failed = 0
-    total_skipped = 0
-    total_duration = 0.0
-
-    # Handle both <testsuites> and <testsuite> root elements
-    if root.tag == "testsuites":
-        suite_elements = root.findall("testsuite")
-        # Also check if root has attributes (aggregate testsuites)
-        if not suite_elements and root.attrib:
-            # Root is an aggregate testsuites element
-            suite_elements = [root]
-    elif root.tag == "testsuite":
-        suite_elements = [root]
-    else:
-        raise ValueError(f"Unexpected root element: {root.tag}")
-
-    for suite_elem in suite_elements:
-        suite_name = suite_elem.get("name", "Unknown Suite")
-        suite_tests = int(suite_elem.get("tests", 0))
-        suite_failures = int(suite_elem.get("failures", 0))
-        suite_errors = int(suite_elem.get("errors", 0))
-        suite_skipped = int(suite_elem.get("skipped", 0))
-        suite_duration = float(suite_elem.get("time", 0.0))
-
-        test_cases: List[TestCase] = []
-
-        for testcase_elem in suite_elem.findall("testcase"):
-            test_name = testcase_elem.get("name", "Unknown Test")
-            test_classname = testcase_elem.get("classname", "")
-            test_duration = float(testcase_elem.get("time", 0.0))
-
-            # Determine test status
-            status = "passed"
-            error_message = None
-            error_type = None
-            stack_trace = None
-
-            # Check for failure
-            failure_elem = testcase_elem.find("failure")
-            if failure_elem is not None:
-                status = "failed"
-                error_message = failure_elem.text or failure_elem.get("message", "")
-                error_type = failure_elem.get("type", "")
-                stack_trace = failure_elem.text
-
-            # Check for error
-            error_elem = testcase_elem.find("error")
-            if error_elem is not None:
-                status = "failed"  # Errors are treated as failures
-                error_message = error_elem.text or error_elem.get("message", "")
-                error_type = error_elem.get("type", "")
-                stack_trace = error_elem.text
-
-            # Check for skipped
-            skipped_elem = testcase_elem.find("skipped")
-            if skipped_elem is not None:
-                status = "skipped"
-
-            test_case = TestCase(
-                name=test_name,
-                classname=test_classname,
-                status=status,
-                duration=test_duration,
-                error_message=error_message,
-                error_type=error_type,
-                stack_trace=stack_trace,
-            )
-            test_cases.append(test_case)
-
-        suite = TestSuite(
-            name=suite_name,
-            tests=suite_tests,
-            failures=suite_failures,
-            errors=suite_errors,
-            skipped=suite_skipped,
-            duration=suite_duration,
-            test_cases=test_cases,
-        )
-        suites.append(suite)
-
-        total_tests += suite_tests
-        total_failed += suite_failures + suite_errors
-        total_skipped += suite_skipped
-        total_duration += suite_duration
+    total_tests = sum(suite.tests for suite in suites)
+    total_failed = sum(suite.failures + suite.errors for suite in suites)
+    total_skipped = sum(suite.skipped for suite in suites)
+    total_duration = sum((suite.duration for suite in suites), 0.0)
 
     # Calculate passed tests
     total_passed = total_tests - total_failed - total_skipped
@@ -169,3 +83,158 @@ def parse_junit_xml(xml_path: str | Path) -> TestResults:
         total_skipped=total_skipped,
         total_duration=total_duration,
     )
+
+
+def iter_junit_suites(
+    xml_path: str | Path, include_cases: bool = True
+) -> Iterator[TestSuite]:
+    """
+    Stream the test suites of a JUnit XML file one at a time.
+
+    The file is read with iterparse and each suite's elements are released once
+    the suite has been yielded, so the whole document tree is never held in memory.
+
+    Args:
+        xml_path: Path to JUnit XML file
+        include_cases: Build TestCase objects; when False, suites keep only
+            their counts and test_cases is empty
+
+    Returns:
+        Iterator over parsed TestSuite objects
+
+    Raises:
+        FileNotFoundError: If XML file does not exist
+        ET.ParseError: If XML is malformed (raised while iterating)
+        ValueError: If XML structure is invalid (raised while iterating)
+    """
+    xml_path = os.fspath(xml_path)
+
+    # iterparse opens the file right away, so a missing file is reported here
+    # without a separate exists() check
+    try:
+        events = ET.iterparse(xml_path, events=("start", "end"))
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Test results file not found: {xml_path}") from None
+
+    return _iter_suites(xml_path, events, include_cases)
+
+
+def _iter_suites(
+    xml_path: str, events: Iterator[tuple[str, ET.Element]], include_cases: bool
+) -> Iterator[TestSuite]:
+    """Yield suites from an opened iterparse stream (see iter_junit_suites)."""
+    # Handle both <testsuites> and <testsuite> root elements: suites are the
+    # root itself (<testsuite>) or its direct <testsuite> children
+    root_tag = None
+    root_attrib: dict[str, str] = {}
+    suite_depth = 1
+    depth = 0
+    found_suite = False
+    test_cases: List[TestCase] = []
+    root_test_cases: List[TestCase] = []
+    # Shared copies of repeated classname/error type strings for this file
+    strings: dict[str, str] = {}
+
+    try:
+        for event, elem in events:
+            if event == "start":
+                depth += 1
+                if root_tag is None:
+                    root_tag = elem.tag
+                    root_attrib = dict(elem.attrib)
+                    if root_tag == "testsuites":
+                        suite_depth = 2
+                    elif root_tag != "testsuite":
+                        raise ValueError(f"Unexpected root element: {root_tag}")
+                continue
+
+            depth -= 1
+            if elem.tag == "testcase":
+                if depth == suite_depth:
+                    if include_cases:
+                        test_cases.append(_parse_testcase(elem, strings))
+                    elem.clear()
+                elif depth == 1 and root_tag == "testsuites" and include_cases:
+                    # Test case directly under <testsuites>, only used when
+                    # the root turns out to be an aggregate suite
+                    root_test_cases.append(_parse_testcase(elem, strings))
+            elif elem.tag == "testsuite" and depth + 1 == suite_depth:
+                found_suite = True
+                yield _make_suite(elem.attrib, test_cases)
+                test_cases = []
+                elem.clear()
+            elif depth == 0:
+                # End of a <testsuites> root: without <testsuite> children and
+                # with attributes, the root itself is an aggregate suite
+                if root_tag == "testsuites" and not found_suite and root_attrib:
+                    yield _make_suite(root_attrib, root_test_cases)
+    except ET.ParseError as e:
+        raise ET.ParseError(f"Failed to parse XML file {xml_path}: {e}") from e
+
+
+def _make_suite(attrib, test_cases: List[TestCase]) -> TestSuite:
+    """Build a TestSuite from testsuite attributes and its parsed test cases."""
+    get = attrib.get
+    return TestSuite(
+        name=get("name", "Unknown Suite"),
+        tests=int(get("tests", "0")),
+        failures=int(get("failures", "0")),
+        errors=int(get("errors", "0")),
+        skipped=int(get("skipped", "0")),
+        duration=float(get("time", "0")),
+        test_cases=test_cases,
+    )
+
+
+def _parse_testcase(testcase_elem: ET.Element, strings: dict[str, str]) -> TestCase:
+    """
+    Build a TestCase from a <testcase> element.
+
+    Classnames and error types repeat across test cases, so one shared copy
+    of each is kept in strings instead of a new string per test case.
+    """
+    # Read the attribute dict directly rather than through Element.get
+    get = testcase_elem.attrib.get
+    test_name = get("name", "Unknown Test")
+    test_classname = get("classname", "")
+    test_classname = strings.setdefault(test_classname, test_classname)
+    test_duration = float(get("time", "0"))
+
+    # Determine test status
+    status = "passed"
+    error_message = None
+    error_type = None
+    stack_trace = None
+
+    # Find the first <failure>/<error> child of each kind and any <skipped>
+    # child in one pass
+    fault_elems: dict[str, ET.Element] = {}
+    is_skipped = False
+    for child in testcase_elem:
+        tag = child.tag
+        if tag in _FAULT_TAGS:
+            fault_elems.setdefault(tag, child)
+        elif tag == "skipped":
+            is_skipped = True
+
+    # Errors are treated as failures and take precedence over them
+    fault_elem = fault_elems.get("error", fault_elems.get("failure"))
+    if fault_elem is not None:
+        status = "failed"
+        error_message = fault_elem.text or fault_elem.get("message", "")
+        error_type = fault_elem.get("type", "")
+        error_type = strings.setdefault(error_type, error_type)
+        stack_trace = fault_elem.text
+
+    if is_skipped:
+        status = "skipped"
+
+    return TestCase(
+        name=test_name,
+        classname=test_classname,
+        status=status,
+        duration=test_duration,
+        error_message=error_message,
+        error_type=error_type,
+        stack_trace=stack_trace,
+    )
@@ -13,7 +13,7 @@ def temp_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_junit_all_pass():
     """Sample JUnit XML with all tests passing."""
     return """<?xml version="1.0" encoding="UTF-8"?>
@@ -27,7 +27,7 @@ def sample_junit_all_pass():
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_junit_some_fail():
     """Sample JUnit XML with some tests failing."""
     return """<?xml version="1.0" encoding="UTF-8"?>
@@ -45,7 +45,7 @@ def sample_junit_some_fail():
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_junit_all_fail():
     """Sample JUnit XML with all tests failing."""
     return """<?xml version="1.0" encoding="UTF-8"?>
@@ -62,7 +62,7 @@ def sample_junit_all_fail():
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_junit_empty():
     """Sample JUnit XML with no tests."""
     return """<?xml version="1.0" encoding="UTF-8"?>
@@ -73,7 +73,7 @@ def sample_junit_empty():
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_junit_malformed():
     """Malformed JUnit XML."""
     return """<?xml version="1.0" encoding="UTF-8"?>
@@ -1,11 +1,14 @@
 """Tests for formatter module."""
 
+import io
+
 import pytest
 
 from test_summary.formatter import (
     format_duration,
     generate_markdown_summary,
     get_status_emoji,
+    write_markdown_summary,
 )
 from test_summary.parser import TestCase, TestResults, TestSuite
 
@@ -227,3 +230,31 @@ def test_generate_markdown_multiple_suites():
     assert "suite1" in summary
     assert "suite2" in summary
     assert "3 tests in 2 suite(s)" in summary
+
+
+def test_write_markdown_summary_matches_generated():
+    """Test streaming the summary writes the same content as generating it."""
+    suite = TestSuite(
+        name="suite1",
+        tests=1,
+        failures=1,
+        errors=0,
+        skipped=0,
+        duration=0.5,
+        test_cases=[
+            TestCase("test1", "suite1", "failed", 0.5, error_message="Failed"),
+        ],
+    )
+    results = TestResults(
+        suites=[suite],
+        total_tests=1,
+        total_passed=0,
+        total_failed=1,
+        total_skipped=0,
+        total_duration=0.5,
+    )
+
+    out = io.StringIO()
+    write_markdown_summary(results, out, "artifact")
+
+    assert out.getvalue() == generate_markdown_summary(results, "artifact") + "\n"
@@ -9,6 +9,7 @@ from test_summary.parser import (
     TestCase,
     TestResults,
     TestSuite,
+    iter_junit_suites,
     parse_junit_xml,
 )
 
@@ -165,3 +166,91 @@ def test_parse_junit_multiple_suites(temp_dir):
     assert results.total_tests == 3
     assert results.total_passed == 2
     assert results.total_failed == 1
+
+
+def test_iter_junit_suites_aggregate_root(temp_dir):
+    """Test streaming a <testsuites> root that is itself the suite."""
+    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuites name="aggregate" tests="2" failures="1" errors="0" skipped="0" time="1.0">
+  <testcase name="test1" classname="aggregate" time="0.5"/>
+  <testcase name="test2" classname="aggregate" time="0.5">
+    <failure message="Failed">Test failed</failure>
+  </testcase>
+</testsuites>
+"""
+    xml_file = temp_dir / "test-results.xml"
+    xml_file.write_text(xml_content)
+
+    suites = list(iter_junit_suites(xml_file))
+
+    assert [suite.name for suite in suites] == ["aggregate"]
+    assert [tc.status for tc in suites[0].test_cases] == ["passed", "failed"]
+
+
+def test_iter_junit_suites_missing_file(temp_dir):
+    """Test that a missing file is reported before iteration starts."""
+    with pytest.raises(FileNotFoundError):
+        iter_junit_suites(temp_dir / "missing.xml")
+
+
+def test_parse_junit_error_overrides_failure(temp_dir):
+    """Test that an <error> child wins over a <failure> child."""
+    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuite name="unit_test" tests="1" failures="0" errors="1" skipped="0" time="0.1">
+  <testcase name="test_one" classname="unit_test" time="0.1">
+    <error type="RuntimeError" message="crashed">boom</error>
+    <failure type="AssertionError" message="failed">nope</failure>
+  </testcase>
+</testsuite>
+"""
+    xml_file = temp_dir / "test-results.xml"
+    xml_file.write_text(xml_content)
+
+    test_case = parse_junit_xml(xml_file).suites[0].test_cases[0]
+
+    assert test_case.status == "failed"
+    assert test_case.error_type == "RuntimeError"
+    assert test_case.error_message == "boom"
+
+
+def test_parse_junit_shares_classname_strings(sample_junit_all_pass, temp_dir):
+    """Test that test cases with the same classname share one string."""
+    xml_file = temp_dir / "test-results.xml"
+    xml_file.write_text(sample_junit_all_pass)
+
+    first, second, third = parse_junit_xml(xml_file).suites[0].test_cases
+
+    assert first.classname is second.classname is third.classname
+
+
+def test_parse_junit_without_cases(sample_junit_some_fail, temp_dir):
+    """Test that include_cases=False keeps suite counts but no test cases."""
+    xml_file = temp_dir / "test-results.xml"
+    xml_file.write_text(sample_junit_some_fail)
+
+    results = parse_junit_xml(xml_file, include_cases=False)
+
+    assert results.total_tests == 3
+    assert results.total_failed == 1
+    assert results.suites[0].test_cases == []
+    assert parse_junit_xml(xml_file).suites[0].test_cases
+
+
+def test_iter_junit_suites_without_cases(temp_dir):
+    """Test that include_cases=False skips test cases on every suite layout."""
+    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuites name="aggregate" tests="2" failures="1" errors="0" skipped="0" time="1.0">
+  <testcase name="test1" classname="aggregate" time="0.5"/>
+  <testcase name="test2" classname="aggregate" time="0.5">
+    <failure message="Failed">Test failed</failure>
+  </testcase>
+</testsuites>
+"""
+    xml_file = temp_dir / "test-results.xml"
+    xml_file.write_text(xml_content)
+
+    (suite,) = iter_junit_suites(xml_file, include_cases=False)
+
+    assert suite.failures == 1
+    assert suite.test_cases == []
+
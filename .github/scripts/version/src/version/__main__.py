@@ -3,12 +3,6 @@ import os
 import subprocess
 import sys
 
-import tomlkit
-
-from version.cargo import update_cargo_version
-from version.github_client import GitHubClient
-from version.version import calculate_new_version, calculate_pr_version
-
 
 def main() -> None:
     """Main execution logic."""
@@ -28,6 +22,12 @@ def main() -> None:
         print("Error: GITHUB_REPOSITORY environment variable not set")
         sys.exit(1)
 
+    # Import the heavy dependencies (PyGithub, packaging, semver) only
+    # once the required environment is known to be present
+    from version.cargo import update_cargo_lock_version, update_cargo_version
+    from version.github_client import GitHubClient
+    from version.version import calculate_new_version, calculate_pr_version
+
     # Initialize GitHub client
     try:
         github_client = GitHubClient(token, repo_name)
@@ -63,7 +63,10 @@ def main() -> None:
         try:
             print("Calculating PR version...")
             version = calculate_pr_version(
-                github_client, pr_number, commit_sha, repo_path=repo_root
+                github_client,
+                pr_number,
+                commit_sha,
+                cargo_toml_path=cargo_toml_path,
             )
             tag_name = f"v{version}"  # For consistency, though not used in PR mode
         except Exception as e:
@@ -76,7 +79,9 @@ def main() -> None:
 
         try:
             print("Calculating new version...")
-            version, tag_name = calculate_new_version(github_client, repo_path=repo_root)
+            version, tag_name = calculate_new_version(
+                github_client, cargo_toml_path=cargo_toml_path
+            )
         except Exception as e:
             print(f"Error calculating version: {e}")
             sys.exit(1)
@@ -84,30 +89,24 @@ def main() -> None:
     # Update Cargo.toml (use full path)
     try:
         print(f"Updating Cargo.toml with version {version}...")
-        version_updated = update_cargo_version(cargo_toml_path, version)
+        version_updated, package_name = update_cargo_version(cargo_toml_path, version)
         if version_updated:
             print(f"✓ Cargo.toml updated to version {version}")
 
             # Update Cargo.lock with the new version
-            # Read package name from Cargo.toml
-            try:
-                with open(cargo_toml_path, "r", encoding="utf-8") as f:
-                    cargo = tomlkit.parse(f.read())
-                package_name = cargo.get("package", {}).get("name", "moved_maker")
-            except Exception as e:
-                print(f"Warning: Could not read package name from Cargo.toml: {e}")
-                print("Using default package name: moved_maker")
-                package_name = "moved_maker"
-
+            # Rewrite the package entry directly; only run cargo's resolver when
+            # the entry cannot be found
             try:
                 print(f"Updating Cargo.lock with version {version}...")
-                result = subprocess.run(
-                    ["cargo", "update", "--package", package_name],
-                    cwd=repo_root,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
+                lock_path = os.path.join(repo_root, "Cargo.lock")
+                if not update_cargo_lock_version(lock_path, package_name, version):
+                    result = subprocess.run(
+                        ["cargo", "update", "--package", package_name],
+                        cwd=repo_root,
+                        capture_output=True,
+                        text=True,
+                        check=True,
+                    )
                 print(f"✓ Cargo.lock updated to version {version}")
             except subprocess.CalledProcessError as e:
                 print(f"Error updating Cargo.lock: {e}")
@@ -135,8 +134,7 @@ def main() -> None:
     if output_file:
         try:
             with open(output_file, "a", encoding="utf-8") as f:
-                f.write(f"version={version}\n")
-                f.write(f"tag_name={tag_name}\n")
+                f.write(f"version={version}\ntag_name={tag_name}\n")
         except Exception as e:
             print(f"Error writing to GITHUB_OUTPUT: {e}")
             sys.exit(1)
@@ -1,12 +1,27 @@
 """Cargo.toml manipulation functions."""
+import os
+import re
+import shutil
 import sys
+import tempfile
+import tomllib
 from pathlib import Path
+from typing import Any, BinaryIO, Mapping, Optional, Tuple, Union
 
 import semver
-import tomlkit
 
+# The basic-string version line of the [package] table, split into
+# (prefix up to the opening quote, version, closing quote)
+_PACKAGE_VERSION_RE = re.compile(
+    r'^(\[package\][ \t]*(?:#[^\n]*)?\n(?:(?!\[)[^\n]*\n)*?[ \t]*version[ \t]*=[ \t]*")'
+    r'([^"\n]*)(")',
+    re.MULTILINE,
+)
 
-def read_cargo_version(path: str = "Cargo.toml") -> str:
+
+def read_cargo_version(
+    source: Union[str, os.PathLike, bytes, BinaryIO] = "Cargo.toml",
+) -> str:
     """Read version from Cargo.toml.
 
     Supports standard semantic versions as well as versions with pre-release
@@ -14,7 +29,8 @@ def read_cargo_version(path: str = "Cargo.toml") -> str:
     SemVer 2.0.0 specification. Uses the `semver` package for validation.
 
     Args:
-        path: Path to Cargo.toml file
+        source: Path to Cargo.toml file, its raw content, or a binary file
+            object to read it from
 
     Returns:
         Version string from package.version (validated as semantic version)
@@ -24,47 +40,92 @@ def read_cargo_version(path: str = "Cargo.toml") -> str:
         ValueError: If version field is missing, empty, or invalid format
     """
     try:
-        cargo_path = Path(path)
-        if not cargo_path.exists():
-            raise FileNotFoundError(f"Cargo.toml not found at {path}")
+        if isinstance(source, (bytes, bytearray)):
+            cargo = tomllib.loads(source.decode("utf-8"))
+        elif hasattr(source, "read"):
+            cargo = tomllib.load(source)
+        else:
+            # Let open() report a missing file instead of a separate exists() stat
+            try:
+                f = open(source, "rb")
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Cargo.toml not found at {source}") from None
+            with f:
+                cargo = tomllib.load(f)
 
-        with open(cargo_path, "r", encoding="utf-8") as f:
-            cargo = tomlkit.parse(f.read())
+        return _get_package_version(cargo)
+    except tomllib.TOMLDecodeError as e:
+        print(f"Error parsing Cargo.toml: {e}")
+        raise ValueError(f"Invalid TOML format: {e}") from e
 
-        if "package" not in cargo:
-            raise ValueError("No [package] section found in Cargo.toml")
 
-        if "version" not in cargo["package"]:
-            raise ValueError("No version field found in [package] section")
+def _get_package_version(cargo: Mapping[str, Any]) -> str:
+    """Get and validate package.version from a parsed Cargo.toml document.
 
-        version = str(cargo["package"]["version"])
-        if not version:
-            raise ValueError("Version field is empty")
+    Args:
+        cargo: Parsed Cargo.toml document
 
-        # Reject versions with 'v' prefix (not standard for Cargo.toml)
-        if version.startswith("v") or version.startswith("V"):
-            raise ValueError(
-                f"Invalid version format in Cargo.toml: {version}. "
-                "Version should not include 'v' prefix. Expected semantic version (e.g., 1.0.0)"
-            )
+    Returns:
+        Version string from package.version (validated as semantic version)
 
-        # Validate SemVer 2.0.0 format using semver package
-        # This handles all formats: standard, pre-release, build metadata, and combinations
-        try:
-            semver.Version.parse(version)
-        except ValueError as e:
-            raise ValueError(
-                f"Invalid version format in Cargo.toml: {version}. "
-                "Expected semantic version (e.g., 1.0.0)"
-            ) from e
+    Raises:
+        ValueError: If version field is missing, empty, or invalid format
+    """
+    if "package" not in cargo:
+        raise ValueError("No [package] section found in Cargo.toml")
+
+    if "version" not in cargo["package"]:
+        raise ValueError("No version field found in [package] section")
+
+    return _validate_version(str(cargo["package"]["version"]))
+
+
+def _validate_version(version: str) -> str:
+    """Validate a Cargo.toml version string as a semantic version.
+
+    Args:
+        version: Version string to validate
+
+    Returns:
+        The version string, unchanged
 
+    Raises:
+        ValueError: If version is empty or has an invalid format
+    """
+    if not version:
+        raise ValueError("Version field is empty")
+
+    # Reject versions with 'v' prefix (not standard for Cargo.toml)
+    if version[0] in "vV":
+        raise ValueError(
+            f"Invalid version format in Cargo.toml: {version}. "
+            "Version should not include 'v' prefix. Expected semantic version (e.g., 1.0.0)"
+        )
+
+    # Fast path for plain MAJOR.MINOR.PATCH: ASCII digits without leading zeros
+    parts = version.split(".")
+    if len(parts) == 3 and all(
+        part.isascii() and part.isdigit() and (part == "0" or part[0] != "0")
+        for part in parts
+    ):
         return version
-    except tomlkit.exceptions.TOMLKitError as e:
-        print(f"Error parsing Cargo.toml: {e}")
-        raise ValueError(f"Invalid TOML format: {e}") from e
+
+    # Validate SemVer 2.0.0 format using semver package
+    # This handles all formats: standard, pre-release, build metadata, and combinations
+    try:
+        semver.Version.parse(version)
+    except ValueError as e:
+        raise ValueError(
+            f"Invalid version format in Cargo.toml: {version}. "
+            "Expected semantic version (e.g., 1.0.0)"
+        ) from e
+
+    return version
 
 
-def update_cargo_version(path: str = "Cargo.toml", version: str = "") -> bool:
+def update_cargo_version(
+    path: str = "Cargo.toml", version: str = ""
+) -> Tuple[bool, str]:
     """Update version in Cargo.toml.
 
     Only writes the file if the version is different from the current version.
@@ -75,7 +136,8 @@ def update_cargo_version(path: str = "Cargo.toml", version: str = "") -> bool:
         version: New version string to set
 
     Returns:
-        True if version was updated, False if version was unchanged
+        Tuple of (updated, package_name) where updated is True if the version
+        was changed, and package_name is package.name (default "moved_maker")
 
     Raises:
         FileNotFoundError: If Cargo.toml doesn't exist
@@ -83,43 +145,160 @@ def update_cargo_version(path: str = "Cargo.toml", version: str = "") -> bool:
     """
     try:
         cargo_path = Path(path)
-        if not cargo_path.exists():
-            raise FileNotFoundError(f"Cargo.toml not found at {path}")
+
+        # Read once: the same text is checked, updated and written back.
+        # open() reports a missing file, so there is no separate exists() stat
+        try:
+            with open(cargo_path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Cargo.toml not found at {path}") from None
 
         if not version:
             raise ValueError("Version cannot be empty")
 
-        # Read current version first
-        current_version = read_cargo_version(path)
+        cargo_data = tomllib.loads(content)
+        current_version = _get_package_version(cargo_data)
+        package_name = cargo_data["package"].get("name", "moved_maker")
 
         # Check if version is different
         if current_version == version:
             print(f"Cargo.toml version is already {version}, no update needed")
-            return False
-
-        # Read current file
-        with open(cargo_path, "r", encoding="utf-8") as f:
-            cargo = tomlkit.parse(f.read())
+            return False, package_name
 
-        if "package" not in cargo:
-            raise ValueError("No [package] section found in Cargo.toml")
+        # Validate the new version in memory instead of re-reading the file
+        # after writing it
+        _validate_version(version)
 
-        # Update version
-        cargo["package"]["version"] = version
+        # Rewrite only the version line, falling back to a full tomlkit
+        # round-trip for layouts the line pattern does not cover
+        updated = _replace_package_version(content, version)
+        if updated is None:
+            updated = _render_with_tomlkit(content, version)
 
         # Write back
-        with open(cargo_path, "w", encoding="utf-8") as f:
-            f.write(tomlkit.dumps(cargo))
-
-        # Verify update
-        updated_version = read_cargo_version(path)
-        if updated_version != version:
-            raise ValueError(
-                f"Version update failed: expected {version}, got {updated_version}"
-            )
+        _write_atomic(cargo_path, updated)
 
         print(f"Updated Cargo.toml version from {current_version} to {version}")
-        return True
+        return True, package_name
+    except tomllib.TOMLDecodeError as e:
+        print(f"Error parsing Cargo.toml: {e}")
+        raise ValueError(f"Invalid TOML format: {e}") from e
+
+
+def _render_with_tomlkit(content: str, version: str) -> str:
+    """Set package.version with a formatting-preserving tomlkit round-trip.
+
+    tomlkit is imported here so runs that never need this fallback do not
+    pay for importing it.
+
+    Args:
+        content: Current Cargo.toml text
+        version: New version string to set
+
+    Returns:
+        Updated Cargo.toml text
+
+    Raises:
+        ValueError: If tomlkit cannot parse the document
+    """
+    import tomlkit
+
+    try:
+        cargo = tomlkit.parse(content)
     except tomlkit.exceptions.TOMLKitError as e:
         print(f"Error parsing Cargo.toml: {e}")
         raise ValueError(f"Invalid TOML format: {e}") from e
+    cargo["package"]["version"] = version
+    return cargo.as_string()
+
+
+def _replace_package_version(content: str, version: str) -> Optional[str]:
+    """Replace package.version in Cargo.toml text without a full TOML round-trip.
+
+    Args:
+        content: Cargo.toml file content
+        version: New version string to set
+
+    Returns:
+        Updated content, or None if the version line could not be replaced safely
+    """
+    match = _PACKAGE_VERSION_RE.search(content)
+    if match is None:
+        return None
+
+    updated = content[: match.start(2)] + version + content[match.end(2) :]
+
+    # Guard against a match outside the real [package] table
+    if tomllib.loads(updated).get("package", {}).get("version") != version:
+        return None
+    return updated
+
+
+def update_cargo_lock_version(path: str, package_name: str, version: str) -> bool:
+    """Update the version of a workspace package in Cargo.lock.
+
+    Rewrites the version line of the package's own [[package]] entry in place,
+    which is all `cargo update --package` changes for a version bump of a local
+    crate (local entries carry no source or checksum).
+
+    Args:
+        path: Path to Cargo.lock file
+        package_name: Name of the local package
+        version: New version string to set
+
+    Returns:
+        True if Cargo.lock was updated, False if the entry could not be found
+        or more than one entry has the name (callers should fall back to
+        `cargo update`)
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except (FileNotFoundError, IsADirectoryError):
+        return False
+
+    entry = r'^\[\[package\]\]\nname = "' + re.escape(package_name) + r'"\n'
+
+    # A name shared with another entry (e.g. a registry crate of the same
+    # name) is ambiguous, so leave it to cargo
+    if len(re.findall(entry, content, re.MULTILINE)) != 1:
+        return False
+
+    pattern = re.compile(
+        "(" + entry + r'version = ")([^"\n]*)("\n)(?!source = )', re.MULTILINE
+    )
+    match = pattern.search(content)
+    if match is None:
+        return False
+
+    if match.group(2) != version:
+        _write_atomic(
+            Path(path), content[: match.start(2)] + version + content[match.end(2) :]
+        )
+    return True
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    """Replace a file's content atomically.
+
+    The content is written to a uniquely named temporary file next to the
+    real target (symlinks resolved), which then replaces it with os.replace,
+    so a crash never leaves a half-written file and a symlink keeps pointing
+    at the updated file.
+
+    Args:
+        path: Existing file (or symlink to one) to replace
+        content: New file content
+    """
+    target = os.path.realpath(path)
+    directory, name = os.path.split(target)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -17,7 +17,8 @@ class GitHubClient:
             token: GitHub personal access token or app token
             repo_name: Repository name in format "owner/repo"
         """
-        self.github = Github(auth=Auth.Token(token))
+        # Request the maximum page size to minimize pagination round-trips
+        self.github = Github(auth=Auth.Token(token), per_page=100)
         self.repo_name = repo_name
         self._repo: Optional[Repository] = None
 
@@ -69,8 +70,9 @@ class GitHubClient:
                     if pr.merged_at:
                         prs.append(pr)
                 else:
-                    # Stop if we've gone past the tag date (PRs are sorted by updated_at)
-                    if pr.updated_at and pr.updated_at.timestamp() < since_timestamp:
+                    # Stop if we've gone past the tag date (PRs are sorted by updated_at).
+                    # A PR last updated at or before the tag cannot have merged after it.
+                    if pr.updated_at and pr.updated_at.timestamp() <= since_timestamp:
                         break
 
                     # Only include merged PRs after the tag date
@@ -1,4 +1,5 @@
 """Version calculation logic."""
+import re
 import subprocess
 import sys
 from typing import Optional, Tuple
@@ -8,6 +9,24 @@ from packaging.version import InvalidVersion, Version
 
 from version.cargo import read_cargo_version
 
+# Plain MAJOR.MINOR.PATCH, the common case for tag-derived base versions.
+# ASCII digits only: packaging rejects other Unicode digits, and so must the
+# fast path
+_RELEASE_VERSION_RE = re.compile(r"([0-9]+)\.([0-9]+)\.([0-9]+)")
+
+# Hexadecimal commit SHA (or prefix of one)
+_HEX_RE = re.compile(r"[0-9a-fA-F]+")
+
+# Nearest v* tag reachable from HEAD
+_LATEST_TAG_CMD = ("git", "describe", "--tags", "--match", "v*", "--abbrev=0")
+
+# Paths whose commits count towards the patch number
+_APPLICATION_PATHSPEC = ("--", "src/", "Cargo.toml", "Cargo.lock")
+
+# PR labels that request a major or minor version bump
+_MAJOR_LABELS = frozenset({"version: major", "breaking"})
+_MINOR_LABELS = frozenset({"version: minor", "feature"})
+
 
 def shorten_commit_sha(sha: str, length: int = 7) -> str:
     """Shorten commit SHA to specified length.
@@ -26,12 +45,14 @@ def shorten_commit_sha(sha: str, length: int = 7) -> str:
         raise ValueError("Commit SHA cannot be empty")
     if length < 1:
         raise ValueError(f"Length must be at least 1, got {length}")
-    if not sha.isalnum():
-        raise ValueError(f"Invalid SHA format: {sha} (must be alphanumeric)")
 
     # Ensure we don't exceed the SHA length (40 characters for full SHA)
     actual_length = min(length, len(sha))
-    return sha[:actual_length]
+    short_sha = sha[:actual_length]
+    # Only the returned prefix needs to be valid
+    if not _HEX_RE.fullmatch(short_sha):
+        raise ValueError(f"Invalid SHA format: {sha} (must be hexadecimal)")
+    return short_sha
 
 
 def get_latest_tag() -> Optional[str]:
@@ -42,7 +63,7 @@ def get_latest_tag() -> Optional[str]:
     """
     try:
         result = subprocess.run(
-            ["git", "describe", "--tags", "--match", "v*", "--abbrev=0"],
+            _LATEST_TAG_CMD,
             capture_output=True,
             text=True,
             check=False,
@@ -69,7 +90,7 @@ def get_tag_timestamp(tag: str) -> int:
     """
     try:
         result = subprocess.run(
-            ["git", "log", "-1", "--format=%ct", tag],
+            ("git", "log", "-1", "--format=%ct", tag),
             capture_output=True,
             text=True,
             check=True,
@@ -109,16 +130,7 @@ def get_commit_count(since_tag: Optional[str] = None) -> int:
             rev_range = "HEAD"
 
         result = subprocess.run(
-            [
-                "git",
-                "rev-list",
-                "--count",
-                rev_range,
-                "--",
-                "src/",
-                "Cargo.toml",
-                "Cargo.lock",
-            ],
+            ("git", "rev-list", "--count", rev_range, *_APPLICATION_PATHSPEC),
             capture_output=True,
             text=True,
             check=True,
@@ -152,11 +164,13 @@ def determine_bump_type(prs) -> str:
     minor_bump = False
 
     for pr in prs:
-        labels = [label.name for label in pr.labels]
-        if any(label in labels for label in ["version: major", "breaking"]):
+        labels = {label.name for label in pr.labels}
+        if not labels.isdisjoint(_MAJOR_LABELS):
             major_bump = True
             print(f"PR #{pr.number} has major version label")
-        elif any(label in labels for label in ["version: minor", "feature"]):
+            # MAJOR outranks everything, so the remaining PRs cannot change the result
+            break
+        elif not labels.isdisjoint(_MINOR_LABELS):
             minor_bump = True
             print(f"PR #{pr.number} has minor version label")
 
@@ -188,8 +202,13 @@ def calculate_version(
         InvalidVersion: If base_version is not a valid version, or if calculated version is invalid (should not happen)
     """
     try:
-        parsed_version = packaging_version.parse(base_version)
-        major, minor, patch = parsed_version.release[:3]
+        # Fast path for plain versions; anything else goes through packaging
+        match = _RELEASE_VERSION_RE.fullmatch(base_version)
+        if match:
+            major, minor, patch = map(int, match.groups())
+        else:
+            parsed_version = packaging_version.parse(base_version)
+            major, minor, patch = parsed_version.release[:3]
 
         if bump_type == "MAJOR":
             new_version = f"{major + 1}.0.0"
@@ -198,14 +217,13 @@ def calculate_version(
         else:  # PATCH
             new_version = f"{major}.{minor}.{patch + commit_count}"
 
-        # Validate calculated version (defensive programming)
-        try:
-            Version(new_version)
-        except InvalidVersion as e:
+        # Validate calculated version (defensive programming); it is always
+        # built as MAJOR.MINOR.PATCH, so the release pattern is enough
+        if not _RELEASE_VERSION_RE.fullmatch(new_version):
             raise InvalidVersion(
                 f"Calculated invalid version: {new_version}. "
                 "This should not happen - please report this bug."
-            ) from e
+            )
 
         return new_version
     except (InvalidVersion, ValueError, IndexError) as e:
@@ -214,13 +232,13 @@ def calculate_version(
 
 
 def calculate_new_version(
-    github_client, repo_path: str = "."
+    github_client, cargo_toml_path: str = "Cargo.toml"
 ) -> Tuple[str, str]:
     """Calculate new version from PR labels and git tags.
 
     Args:
         github_client: GitHubClient instance
-        repo_path: Path to repository root (for reading Cargo.toml)
+        cargo_toml_path: Path to Cargo.toml (used when no tag exists yet)
 
     Returns:
         Tuple of (version, tag_name) where tag_name includes 'v' prefix
@@ -229,14 +247,13 @@ def calculate_new_version(
         ValueError: If version calculation fails, or if tag version format is invalid
     """
     latest_tag = get_latest_tag()
-    cargo_path = f"{repo_path}/Cargo.toml" if repo_path != "." else "Cargo.toml"
 
     # Determine base version and timestamp based on whether tag exists
     if not latest_tag:
         print("No tags found - this will be the first release")
         # First release - get base version from Cargo.toml
         print("Determining base version from Cargo.toml...")
-        base_version = read_cargo_version(cargo_path)
+        base_version = read_cargo_version(cargo_toml_path)
         print(f"Base version from Cargo.toml: {base_version}")
         # Use timestamp 0 to get all PRs, and None for commit count (count all commits)
         tag_timestamp = 0
@@ -245,7 +262,7 @@ def calculate_new_version(
         print(f"Found latest tag: {latest_tag}")
         # Extract version from tag (remove 'v' prefix)
         print(f"Extracting base version from tag: {latest_tag}")
-        base_version = latest_tag.lstrip("v")
+        base_version = latest_tag.removeprefix("v")
         print(f"Base version: {base_version}")
 
         # Validate tag version format immediately
@@ -294,7 +311,7 @@ def calculate_pr_version(
     github_client,
     pr_number: int,
     commit_sha: str,
-    repo_path: str = ".",
+    cargo_toml_path: str = "Cargo.toml",
 ) -> str:
     """Calculate PR version with pre-release identifier and build metadata.
 
@@ -306,7 +323,7 @@ def calculate_pr_version(
         github_client: GitHubClient instance
         pr_number: Pull request number
         commit_sha: Full commit SHA
-        repo_path: Path to repository root (for reading Cargo.toml)
+        cargo_toml_path: Path to Cargo.toml (used when no tag exists yet)
 
     Returns:
         PR version string in format: X.Y.Z-pr[NUMBER]+[SHORT-SHA] (e.g., "1.2.3-pr123+abc1234")
@@ -321,18 +338,17 @@ def calculate_pr_version(
 
     # Get base version using same logic as release
     latest_tag = get_latest_tag()
-    cargo_path = f"{repo_path}/Cargo.toml" if repo_path != "." else "Cargo.toml"
 
     # Determine base version and timestamp based on whether tag exists
     if not latest_tag:
         print("No tags found - using Cargo.toml version as base")
-        base_version = read_cargo_version(cargo_path)
+        base_version = read_cargo_version(cargo_toml_path)
         print(f"Base version from Cargo.toml: {base_version}")
         tag_timestamp = 0
         tag_for_commit_count = None
     else:
         print(f"Found latest tag: {latest_tag}")
-        base_version = latest_tag.lstrip("v")
+        base_version = latest_tag.removeprefix("v")
         print(f"Base version: {base_version}")
 
         # Validate tag version format
@@ -368,14 +384,6 @@ def calculate_pr_version(
     # Format as semantic version with pre-release and build metadata
     pr_version = f"{base_new_version}-pr{pr_number}+{short_sha}"
 
-    # Validate the full PR version format
-    try:
-        # Note: packaging.version.Version doesn't support build metadata in pre-release,
-        # but we can validate the base version and format separately
-        Version(base_new_version)
-    except InvalidVersion as e:
-        raise ValueError(f"Invalid calculated base version: {base_new_version}") from e
-
     # Log comprehensive summary
     print("=" * 50)
     print("PR Version Calculation Summary:")
@@ -1,6 +1,4 @@
 """Pytest configuration and fixtures."""
-import tempfile
-from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
@@ -33,31 +31,25 @@ def mock_pr():
 
 
 @pytest.fixture
-def temp_cargo_toml():
+def temp_cargo_toml(tmp_path):
     """Create a temporary Cargo.toml file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-        f.write(
-            """[package]
+    temp_path = tmp_path / "Cargo.toml"
+    temp_path.write_text(
+        """[package]
 name = "test-package"
 version = "1.0.0"
 edition = "2021"
 """
-        )
-        temp_path = Path(f.name)
-
-    yield temp_path
-
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+    )
+    return temp_path
 
 
 @pytest.fixture
-def sample_cargo_toml_with_deps():
+def sample_cargo_toml_with_deps(tmp_path):
     """Create a temporary Cargo.toml with dependencies."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-        f.write(
-            """[package]
+    temp_path = tmp_path / "Cargo.toml"
+    temp_path.write_text(
+        """[package]
 name = "test-package"
 version = "2.3.1"
 edition = "2021"
@@ -65,11 +57,5 @@ edition = "2021"
 [dependencies]
 some-dep = "1.0.0"
 """
-        )
-        temp_path = Path(f.name)
-
-    yield temp_path
-
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+    )
+    return temp_path
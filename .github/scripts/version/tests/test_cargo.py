@@ -1,10 +1,14 @@
 """Tests for cargo module."""
-import tempfile
-from pathlib import Path
+
+import io
 
 import pytest
 
-from version.cargo import read_cargo_version, update_cargo_version
+from version.cargo import (
+    read_cargo_version,
+    update_cargo_lock_version,
+    update_cargo_version,
+)
 
 
 def test_read_cargo_version_valid(temp_cargo_toml):
@@ -21,34 +25,20 @@ def test_read_cargo_version_file_not_found():
 
 def test_read_cargo_version_missing_version():
     """Test reading Cargo.toml without version field."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-        f.write(
-            """[package]
-name = "test"
-"""
-        )
-        temp_path = Path(f.name)
-
-    try:
-        with pytest.raises(ValueError, match="No version field"):
-            read_cargo_version(str(temp_path))
-    finally:
-        if temp_path.exists():
-            temp_path.unlink()
+    with pytest.raises(ValueError, match="No version field"):
+        read_cargo_version(b'[package]\nname = "test"\n')
 
 
 def test_read_cargo_version_invalid_toml():
     """Test reading invalid TOML format."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-        f.write("invalid toml content [")
-        temp_path = Path(f.name)
+    with pytest.raises(ValueError, match="Invalid TOML format"):
+        read_cargo_version(b"invalid toml content [")
+
 
-    try:
-        with pytest.raises(ValueError, match="Invalid TOML format"):
-            read_cargo_version(str(temp_path))
-    finally:
-        if temp_path.exists():
-            temp_path.unlink()
+def test_read_cargo_version_from_file_object():
+    """Test reading the version from a binary file object."""
+    source = io.BytesIO(b'[package]\nname = "test"\nversion = "1.2.3"\n')
+    assert read_cargo_version(source) == "1.2.3"
 
 
 def test_read_cargo_version_invalid_format(datadir):
@@ -89,54 +79,45 @@ def test_read_cargo_version_pr_with_build_metadata(datadir):
     assert version == "0.2.1-pr26+87baede"
 
 
-def test_read_cargo_version_invalid_build_metadata():
+def test_read_cargo_version_invalid_build_metadata(tmp_path):
     """Test reading Cargo.toml with invalid build metadata format."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-        f.write(
-            """[package]
+    temp_path = tmp_path / "Cargo.toml"
+    temp_path.write_text(
+        """[package]
 name = "test"
 version = "1.0.0+invalid@metadata"
 """
-        )
-        temp_path = Path(f.name)
+    )
 
-    try:
-        with pytest.raises(ValueError, match="Invalid version format in Cargo.toml"):
-            read_cargo_version(str(temp_path))
-    finally:
-        if temp_path.exists():
-            temp_path.unlink()
+    with pytest.raises(ValueError, match="Invalid version format in Cargo.toml"):
+        read_cargo_version(str(temp_path))
 
 
-def test_read_cargo_version_empty_build_metadata():
+def test_read_cargo_version_empty_build_metadata(tmp_path):
     """Test reading Cargo.toml with empty build metadata."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-        f.write(
-            """[package]
+    temp_path = tmp_path / "Cargo.toml"
+    temp_path.write_text(
+        """[package]
 name = "test"
 version = "1.0.0+"
 """
-        )
-        temp_path = Path(f.name)
+    )
 
-    try:
-        with pytest.raises(ValueError, match="Invalid version format in Cargo.toml"):
-            read_cargo_version(str(temp_path))
-    finally:
-        if temp_path.exists():
-            temp_path.unlink()
+    with pytest.raises(ValueError, match="Invalid version format in Cargo.toml"):
+        read_cargo_version(str(temp_path))
 
 
 def test_update_cargo_version_valid(temp_cargo_toml):
     """Test updating version in valid Cargo.toml."""
     new_version = "2.0.0"
-    result = update_cargo_version(str(temp_cargo_toml), new_version)
+    result, package_name = update_cargo_version(str(temp_cargo_toml), new_version)
 
     # Verify update
     updated_version = read_cargo_version(str(temp_cargo_toml))
     assert updated_version == new_version
     # Verify return value is True when version changes
     assert result is True
+    assert package_name == "test-package"
 
 
 def test_update_cargo_version_preserves_formatting(sample_cargo_toml_with_deps):
@@ -144,13 +125,14 @@ def test_update_cargo_version_preserves_formatting(sample_cargo_toml_with_deps):
     original_content = sample_cargo_toml_with_deps.read_text()
     new_version = "3.0.0"
 
-    result = update_cargo_version(str(sample_cargo_toml_with_deps), new_version)
+    result, package_name = update_cargo_version(str(sample_cargo_toml_with_deps), new_version)
 
     # Verify version was updated
     updated_version = read_cargo_version(str(sample_cargo_toml_with_deps))
     assert updated_version == new_version
     # Verify return value is True when version changes
     assert result is True
+    assert package_name == "test-package"
 
     # Verify dependencies section still exists
     updated_content = sample_cargo_toml_with_deps.read_text()
@@ -170,16 +152,49 @@ def test_update_cargo_version_empty_version(temp_cargo_toml):
         update_cargo_version(str(temp_cargo_toml), "")
 
 
+def test_update_cargo_version_invalid_version(temp_cargo_toml):
+    """Test that an invalid new version is rejected before writing."""
+    original_content = temp_cargo_toml.read_text()
+
+    with pytest.raises(ValueError, match="Invalid version format"):
+        update_cargo_version(str(temp_cargo_toml), "v2.0.0")
+
+    assert temp_cargo_toml.read_text() == original_content
+
+
+def test_update_cargo_version_leaves_no_temp_file(temp_cargo_toml):
+    """Test that the atomic write cleans up after replacing the file."""
+    temp_cargo_toml.chmod(0o640)
+
+    assert update_cargo_version(str(temp_cargo_toml), "9.9.9")[0] is True
+
+    assert list(temp_cargo_toml.parent.iterdir()) == [temp_cargo_toml]
+    assert temp_cargo_toml.stat().st_mode & 0o777 == 0o640
+    assert read_cargo_version(str(temp_cargo_toml)) == "9.9.9"
+
+
+def test_update_cargo_version_through_symlink(temp_cargo_toml):
+    """Test that updating through a symlink rewrites the target file."""
+    link = temp_cargo_toml.parent / "link.toml"
+    link.symlink_to(temp_cargo_toml)
+
+    assert update_cargo_version(str(link), "9.9.9")[0] is True
+
+    assert link.is_symlink()
+    assert read_cargo_version(str(temp_cargo_toml)) == "9.9.9"
+
+
 def test_update_cargo_version_unchanged(temp_cargo_toml):
     """Test updating with same version (should return False)."""
     current_version = read_cargo_version(str(temp_cargo_toml))
     original_content = temp_cargo_toml.read_text()
 
     # Try to update with the same version
-    result = update_cargo_version(str(temp_cargo_toml), current_version)
+    result, package_name = update_cargo_version(str(temp_cargo_toml), current_version)
 
     # Verify return value is False when version unchanged
     assert result is False
+    assert package_name == "test-package"
 
     # Verify file was not modified
     assert temp_cargo_toml.read_text() == original_content
@@ -191,13 +206,14 @@ def test_update_cargo_version_unchanged(temp_cargo_toml):
 def test_update_cargo_version_pr_with_build_metadata(temp_cargo_toml):
     """Test updating Cargo.toml with PR version format (pre-release + build metadata)."""
     pr_version = "0.2.1-pr26+87baede"
-    result = update_cargo_version(str(temp_cargo_toml), pr_version)
+    result, package_name = update_cargo_version(str(temp_cargo_toml), pr_version)
 
     # Verify update
     updated_version = read_cargo_version(str(temp_cargo_toml))
     assert updated_version == pr_version
     # Verify return value is True when version changes
     assert result is True
+    assert package_name == "test-package"
 
 
 def test_update_cargo_version_pr_with_build_metadata_unchanged(datadir):
@@ -207,13 +223,104 @@ def test_update_cargo_version_pr_with_build_metadata_unchanged(datadir):
     original_content = cargo_toml.read_text()
 
     # Try to update with the same version
-    result = update_cargo_version(str(cargo_toml), current_version)
+    result, package_name = update_cargo_version(str(cargo_toml), current_version)
 
     # Verify return value is False when version unchanged
     assert result is False
+    assert package_name == "test"
 
     # Verify file was not modified
     assert cargo_toml.read_text() == original_content
 
     # Verify version is still the same
     assert read_cargo_version(str(cargo_toml)) == current_version
+
+
+def test_update_cargo_version_only_changes_version_line(tmp_path):
+    """Test updating rewrites only the [package] version line."""
+    content = """[package]
+name = "test"
+authors = [
+    "someone",
+]
+version = "1.0.0"  # keep this comment
+
+[dependencies]
+some-dep = { version = "1.0.0" }
+"""
+    temp_path = tmp_path / "Cargo.toml"
+    temp_path.write_text(content)
+
+    assert update_cargo_version(str(temp_path), "1.1.0") == (True, "test")
+    assert temp_path.read_text() == content.replace(
+        'version = "1.0.0"  #', 'version = "1.1.0"  #'
+    )
+
+
+def test_update_cargo_version_literal_string_fallback(tmp_path):
+    """Test updating a version written as a literal string."""
+    temp_path = tmp_path / "Cargo.toml"
+    temp_path.write_text(
+        """[package]
+name = "test"
+version = '1.0.0'
+"""
+    )
+
+    assert update_cargo_version(str(temp_path), "1.1.0") == (True, "test")
+    assert read_cargo_version(str(temp_path)) == "1.1.0"
+
+
+CARGO_LOCK = """# This file is automatically @generated by Cargo.
+version = 4
+
+[[package]]
+name = "anyhow"
+version = "1.0.0"
+source = "registry+https://github.com/rust-lang/crates.io-index"
+checksum = "abc"
+
+[[package]]
+name = "test-package"
+version = "1.0.0"
+dependencies = [
+ "anyhow",
+]
+"""
+
+
+def test_update_cargo_lock_version(tmp_path):
+    """Test updating the local package entry in Cargo.lock."""
+    lock_path = tmp_path / "Cargo.lock"
+    lock_path.write_text(CARGO_LOCK)
+
+    assert update_cargo_lock_version(str(lock_path), "test-package", "1.1.0") is True
+    assert lock_path.read_text() == CARGO_LOCK.replace(
+        'name = "test-package"\nversion = "1.0.0"',
+        'name = "test-package"\nversion = "1.1.0"',
+    )
+
+
+def test_update_cargo_lock_version_skips_registry_package(tmp_path):
+    """Test that registry packages are not treated as the local package."""
+    lock_path = tmp_path / "Cargo.lock"
+    lock_path.write_text(CARGO_LOCK)
+
+    assert update_cargo_lock_version(str(lock_path), "anyhow", "2.0.0") is False
+    assert lock_path.read_text() == CARGO_LOCK
+
+
+def test_update_cargo_lock_version_duplicate_name(tmp_path):
+    """Test that a name shared by several entries is left to cargo."""
+    lock_path = tmp_path / "Cargo.lock"
+    content = CARGO_LOCK.replace('name = "anyhow"', 'name = "test-package"')
+    lock_path.write_text(content)
+
+    assert update_cargo_lock_version(str(lock_path), "test-package", "1.1.0") is False
+    assert lock_path.read_text() == content
+
+
+def test_update_cargo_lock_version_missing_file(tmp_path):
+    """Test that a missing Cargo.lock is reported as not updated."""
+    lock_path = tmp_path / "Cargo.lock"
+    assert update_cargo_lock_version(str(lock_path), "test-package", "1.1.0") is False
@@ -81,6 +81,39 @@ def test_get_merged_prs_since():
     assert prs[0] == pr1
 
 
+def test_get_merged_prs_since_stops_at_tag_date():
+    """Test that iteration stops at the first PR updated before the timestamp."""
+    pr1 = MagicMock()
+    pr1.merged_at = MagicMock()
+    pr1.merged_at.timestamp.return_value = 2000
+    pr1.updated_at = MagicMock()
+    pr1.updated_at.timestamp.return_value = 2000
+
+    pr2 = MagicMock()
+    pr2.merged_at = MagicMock()
+    pr2.merged_at.timestamp.return_value = 1000
+    pr2.updated_at = MagicMock()
+    pr2.updated_at.timestamp.return_value = 1600
+
+    consumed = []
+
+    def pulls():
+        for pr in (pr1, pr2, MagicMock()):
+            consumed.append(pr)
+            yield pr
+
+    mock_repo = MagicMock()
+    mock_repo.get_pulls.return_value = pulls()
+
+    client = GitHubClient("token", "owner/repo")
+    client._repo = mock_repo
+
+    prs = client.get_merged_prs_since(1600)
+
+    assert prs == [pr1]
+    assert consumed == [pr1, pr2]
+
+
 def test_get_merged_prs_since_api_error():
     """Test getting merged PRs with API error."""
     mock_repo = MagicMock()
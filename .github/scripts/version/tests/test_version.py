@@ -1,4 +1,5 @@
 """Tests for version module."""
+from collections import namedtuple
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -15,6 +16,9 @@ from version.version import (
     shorten_commit_sha,
 )
 
+FakePR = namedtuple("FakePR", "number labels")
+FakeLabel = namedtuple("FakeLabel", "name")
+
 
 def test_get_latest_tag_with_tags():
     """Test getting latest tag when tags exist."""
@@ -76,56 +80,46 @@ def test_get_commit_count():
 
 def test_determine_bump_type_major():
     """Test determining major bump type."""
-    pr1 = MagicMock()
-    pr1.number = 1
-    label1 = MagicMock()
-    label1.name = "version: major"
-    pr1.labels = [label1]
-
-    prs = [pr1]
+    prs = [FakePR(1, [FakeLabel("version: major")])]
     bump_type = determine_bump_type(prs)
     assert bump_type == "MAJOR"
 
 
 def test_determine_bump_type_minor():
     """Test determining minor bump type."""
-    pr1 = MagicMock()
-    pr1.number = 1
-    label1 = MagicMock()
-    label1.name = "version: minor"
-    pr1.labels = [label1]
-
-    prs = [pr1]
+    prs = [FakePR(1, [FakeLabel("version: minor")])]
     bump_type = determine_bump_type(prs)
     assert bump_type == "MINOR"
 
 
 def test_determine_bump_type_patch():
     """Test determining patch bump type (no labels)."""
-    pr1 = MagicMock()
-    pr1.number = 1
-    pr1.labels = []
-
-    prs = [pr1]
+    prs = [FakePR(1, [])]
     bump_type = determine_bump_type(prs)
     assert bump_type == "PATCH"
 
 
 def test_determine_bump_type_multiple_prs_highest_priority():
     """Test that major takes priority over minor."""
-    pr1 = MagicMock()
-    pr1.number = 1
-    label1 = MagicMock()
-    label1.name = "version: minor"
-    pr1.labels = [label1]
-
-    pr2 = MagicMock()
-    pr2.number = 2
-    label2 = MagicMock()
-    label2.name = "version: major"
-    pr2.labels = [label2]
-
-    prs = [pr1, pr2]
+    prs = [
+        FakePR(1, [FakeLabel("version: minor")]),
+        FakePR(2, [FakeLabel("version: major")]),
+    ]
+    bump_type = determine_bump_type(prs)
+    assert bump_type == "MAJOR"
+
+
+def test_determine_bump_type_stops_at_major():
+    """Test that PRs after a major label are not inspected."""
+
+    class UnreadableLabels:
+        def __iter__(self):
+            raise AssertionError("labels read")
+
+    prs = [
+        FakePR(1, [FakeLabel("breaking")]),
+        FakePR(2, UnreadableLabels()),
+    ]
     bump_type = determine_bump_type(prs)
     assert bump_type == "MAJOR"
 
@@ -148,12 +142,24 @@ def test_calculate_version_patch():
     assert new_version == "1.0.3"
 
 
+def test_calculate_version_prerelease_base():
+    """Test calculating version from a base version with pre-release suffix."""
+    new_version = calculate_version("1.2.3rc1", "PATCH", 2)
+    assert new_version == "1.2.5"
+
+
 def test_calculate_version_invalid_base():
     """Test calculating version with invalid base version."""
     with pytest.raises(InvalidVersion):
         calculate_version("invalid", "PATCH", 1)
 
 
+def test_calculate_version_non_ascii_digits():
+    """Test that non-ASCII digits are rejected like packaging rejects them."""
+    with pytest.raises(InvalidVersion):
+        calculate_version("\u0661.\u0662.\u0663", "PATCH", 1)
+
+
 def test_calculate_new_version_invalid_tag():
     """Test calculate_new_version with invalid tag version format."""
     mock_github_client = MagicMock()
@@ -162,7 +168,7 @@ def test_calculate_new_version_invalid_tag():
         mock_get_tag.return_value = "vinvalid-version-string"
 
         with pytest.raises(ValueError, match="Invalid version format in git tag"):
-            calculate_new_version(mock_github_client, repo_path=".")
+            calculate_new_version(mock_github_client, cargo_toml_path="Cargo.toml")
 
 
 def test_calculate_new_version_valid_tag():
@@ -179,7 +185,7 @@ def test_calculate_new_version_valid_tag():
         mock_timestamp.return_value = 1234567890
         mock_commit_count.return_value = 2
 
-        version, tag_name = calculate_new_version(mock_github_client, repo_path=".")
+        version, tag_name = calculate_new_version(mock_github_client, cargo_toml_path="Cargo.toml")
         assert version == "1.0.2"  # PATCH bump with 2 commits
         assert tag_name == "v1.0.2"
 
@@ -197,7 +203,7 @@ def test_calculate_new_version_first_release_invalid_cargo_version():
             )
 
             with pytest.raises(ValueError, match="Invalid version format in Cargo.toml"):
-                calculate_new_version(mock_github_client, repo_path=".")
+                calculate_new_version(mock_github_client, cargo_toml_path="Cargo.toml")
 
 
 def test_calculate_version_validates_output():
@@ -210,6 +216,12 @@ def test_calculate_version_validates_output():
     # If validation fails, an exception would be raised above
 
 
+def test_calculate_version_rejects_invalid_output():
+    """Test that a calculated version that is not MAJOR.MINOR.PATCH is rejected."""
+    with pytest.raises(InvalidVersion):
+        calculate_version("1.0.0", "PATCH", -5)
+
+
 def test_shorten_commit_sha_default_length():
     """Test shortening commit SHA with default length."""
     sha = "abc1234567890def1234567890abc1234567890"
@@ -252,6 +264,12 @@ def test_shorten_commit_sha_invalid_format():
         shorten_commit_sha("abc-123")
 
 
+def test_shorten_commit_sha_not_hexadecimal():
+    """Test that non-hexadecimal SHAs are rejected."""
+    with pytest.raises(ValueError, match="must be hexadecimal"):
+        shorten_commit_sha("xyz1234567890")
+
+
 def test_calculate_pr_version_valid():
     """Test calculating PR version with valid inputs."""
     mock_github_client = MagicMock()
@@ -267,7 +285,7 @@ def test_calculate_pr_version_valid():
         mock_commit_count.return_value = 2
 
         pr_version = calculate_pr_version(
-            mock_github_client, pr_number=123, commit_sha="abc1234567890def1234567890abc1234567890", repo_path="."
+            mock_github_client, pr_number=123, commit_sha="abc1234567890def1234567890abc1234567890", cargo_toml_path="Cargo.toml"
         )
         # Should be: base version (1.0.2) + pr123 + short SHA (abc1234)
         assert pr_version == "1.0.2-pr123+abc1234"
@@ -288,7 +306,7 @@ def test_calculate_pr_version_first_release():
         mock_commit_count.return_value = 0
 
         pr_version = calculate_pr_version(
-            mock_github_client, pr_number=456, commit_sha="def9876543210abc9876543210def9876543210", repo_path="."
+            mock_github_client, pr_number=456, commit_sha="def9876543210abc9876543210def9876543210", cargo_toml_path="Cargo.toml"
         )
         # Should be: base version (0.1.0) + pr456 + short SHA (def9876)
         assert pr_version == "0.1.0-pr456+def9876"
@@ -299,7 +317,7 @@ def test_calculate_pr_version_invalid_pr_number():
     mock_github_client = MagicMock()
 
     with pytest.raises(ValueError, match="PR number must be positive"):
-        calculate_pr_version(mock_github_client, pr_number=0, commit_sha="abc123", repo_path=".")
+        calculate_pr_version(mock_github_client, pr_number=0, commit_sha="abc123", cargo_toml_path="Cargo.toml")
 
 
 def test_calculate_pr_version_empty_sha():
@@ -307,4 +325,4 @@ def test_calculate_pr_version_empty_sha():
     mock_github_client = MagicMock()
 
     with pytest.raises(ValueError, match="Commit SHA cannot be empty"):
-        calculate_pr_version(mock_github_client, pr_number=123, commit_sha="", repo_path=".")
+        calculate_pr_version(mock_github_client, pr_number=123, commit_sha="", cargo_toml_path="Cargo.toml")